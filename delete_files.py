@@ -1,55 +1,415 @@
+from __future__ import annotations
+
 import os
-from pathlib import Path
+import shutil
+import threading
+import time
+import warnings
 from datetime import datetime
 import argparse
+import functools
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Iterator
+
+# Picture files are never touched by the scan
+_PIC_EXTS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.tiff', '.ico')
+
+# Number of files listed before a confirmation prompt, unless verbose
+_PREVIEW_LIMIT = 20
+
+# Seconds a cached scan stays valid
+_CACHE_TTL = 5.0
+
+# Scans known to match nothing:
+# (abs_folder, recursive, lo, hi, file_type) -> (time.monotonic(), folder st_mtime_ns)
+_empty_scans: dict[tuple[str, bool, float | None, float | None, str], tuple[float, int]] = {}
+
+
+def _iter_files(root: str, recursive: bool = False) -> Iterator[os.DirEntry]:
+    """
+    Yield os.DirEntry objects for the files in a folder, optionally walking subfolders.
+    Symlinks are not followed, so linked folders cannot cause loops.
+    
+    Args:
+        root (str): Path to the folder.
+        recursive (bool): If True, also yield files from subfolders. Defaults to False.
+    
+    Yields:
+        os.DirEntry: Entry for each regular file found.
+    """
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            it = os.scandir(folder)
+        except OSError:
+            # Report problems with the top folder, skip unreadable subfolders like os.walk
+            if folder is root:
+                raise
+            continue
+        with it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def _run_jobs(func, items, jobs=None):
+    """
+    Call func on each item, spreading the calls over a thread pool when jobs > 1.
+    File operations release the GIL, so the calls overlap their I/O waits.
+    Items are consumed lazily, so a generator is never materialized.
+    
+    Args:
+        func (callable): Function called with a single item.
+        items (iterable): Items to process.
+        jobs (int): Number of worker threads. If None, uses min(32, 4 * CPU count).
+    
+    Yields:
+        tuple: (item, error) as each call completes; error is None on success.
+    """
+    if jobs is None:
+        jobs = min(32, (os.cpu_count() or 1) * 4)
+    if jobs <= 1:
+        for item in items:
+            try:
+                func(item)
+            except Exception as e:
+                yield item, e
+            else:
+                yield item, None
+        return
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # Keep a bounded number of calls in flight
+        pending = {}
+        try:
+            for item in items:
+                pending[executor.submit(func, item)] = item
+                if len(pending) >= jobs * 4:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.exception()
+        except Exception:
+            # The items iterator failed: report the calls already submitted before re-raising
+            for future in as_completed(pending):
+                yield pending[future], future.exception()
+            raise
+        for future in as_completed(pending):
+            yield pending[future], future.exception()
+
+
+def _print_preview(files, verbose=False, indent="  "):
+    """
+    Print the paths of the files about to be changed, capped at _PREVIEW_LIMIT unless verbose.
+    
+    Args:
+        files (list): Tuples whose first element is the file path.
+        verbose (bool): If True, list every file. Defaults to False.
+        indent (str): Prefix for each line. Defaults to two spaces.
+    """
+    shown = files if verbose else files[:_PREVIEW_LIMIT]
+    for f in shown:
+        print(f"{indent}- {f[0]}")
+    extra = len(files) - len(shown)
+    if extra > 0:
+        print(f"{indent}... and {extra} more")
+
+
+def _prefetch_inodes(paths):
+    """
+    Stat each path so its inode is in the OS cache before it is deleted or moved.
+    Errors are ignored; the real operation reports them.
+    
+    Args:
+        paths (iterable): File paths to touch.
+    """
+    for path in paths:
+        try:
+            os.stat(path)
+        except OSError:
+            pass
+
+
+def _start_prefetch(paths):
+    """
+    Warm the inode cache for paths in a background thread, e.g. while waiting for confirmation.
+    The thread is a daemon, so a cancelled operation doesn't wait for it.
+    
+    Args:
+        paths (list): File paths to touch.
+    """
+    threading.Thread(target=_prefetch_inodes, args=(paths,), daemon=True).start()
+
+
+def _same_filesystem(path_a, path_b):
+    """
+    Check whether two existing paths live on the same filesystem.
+    
+    Args:
+        path_a (str): First path.
+        path_b (str): Second path.
+    
+    Returns:
+        bool: True if both paths share a device, False otherwise or if either cannot be read.
+    """
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except OSError:
+        return False
+
+
+def _move_file(src, dst, same_fs=True):
+    """
+    Move a file, using a plain os.rename when source and destination share a filesystem.
+    Falls back to shutil.move (copy and delete) if the rename fails, e.g. with EXDEV.
+    
+    Args:
+        src (str): Path of the file to move.
+        dst (str): Destination path.
+        same_fs (bool): If True, try os.rename first. Defaults to True.
+    """
+    if same_fs:
+        try:
+            os.rename(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.move(src, dst)
+
+
+def _match_files(folder_path: str, lo: float | None, hi: float | None, recursive: bool,
+                 with_mtime: bool = True) -> Iterator[tuple[str, str, float | None]]:
+    """
+    Yield (full_path, file_name, mtime) for non-picture files whose mtime lies within [lo, hi].
+    
+    Args:
+        folder_path (str): Path to the folder.
+        lo (float): Lowest accepted mtime as a POSIX timestamp. If None, no lower bound.
+        hi (float): Highest accepted mtime as a POSIX timestamp. If None, no upper bound.
+        recursive (bool): If True, search in subfolders.
+        with_mtime (bool): If False and there are no bounds, files are not stat'ed and mtime is None.
+            Defaults to True.
+    
+    Yields:
+        tuple: (full_path, file_name, mtime) for each matching file.
+    """
+    # Local name for the per-file loops
+    pic_exts = _PIC_EXTS
+    # Without bounds or a caller that needs mtimes, readdir alone is enough
+    if lo is None and hi is None and not with_mtime:
+        for entry in _iter_files(folder_path, recursive):
+            name = entry.name
+            # Skip picture files; a bare dotfile like ".png" has no extension
+            if name.lower().endswith(pic_exts) and name.rfind('.') > 0:
+                continue
+            yield entry.path, name, None
+        return
+    for entry in _iter_files(folder_path, recursive):
+        name = entry.name
+        # Skip picture files; a bare dotfile like ".png" has no extension
+        if name.lower().endswith(pic_exts) and name.rfind('.') > 0:
+            continue
+        # Stat once and hand the mtime back so callers don't stat again
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            # The file vanished or became unreadable after readdir
+            continue
+        if lo is not None and mtime < lo:
+            continue
+        if hi is not None and mtime > hi:
+            continue
+        yield entry.path, name, mtime
+
+
+@functools.lru_cache(maxsize=32)
+def _scan(folder_path: str, cwd: str, lo: float | None, hi: float | None, recursive: bool,
+          with_mtime: bool) -> tuple[float, int, tuple[tuple[str, str, float | None], ...]]:
+    """
+    Cached scan of a folder. cwd is only part of the cache key, so relative paths
+    are not shared between working directories.
+    
+    Args:
+        folder_path (str): Path to the folder.
+        cwd (str): Current working directory, used only as part of the cache key.
+        lo (float): Lowest accepted mtime as a POSIX timestamp. If None, no lower bound.
+        hi (float): Highest accepted mtime as a POSIX timestamp. If None, no upper bound.
+        recursive (bool): If True, search in subfolders.
+        with_mtime (bool): If False and there are no bounds, files are not stat'ed and mtime is None.
+    
+    Returns:
+        tuple: (time.monotonic() of the scan, folder st_mtime_ns, tuple of (full_path, file_name, mtime) tuples)
+    """
+    # Read the folder mtime first, so changes made during the scan invalidate it
+    folder_mtime = os.stat(folder_path).st_mtime_ns
+    return time.monotonic(), folder_mtime, tuple(_match_files(folder_path, lo, hi, recursive, with_mtime))
+
+
+def _folder_changed(folder_path, folder_mtime):
+    """
+    Check whether a folder's entries may have changed since its mtime was recorded.
+    
+    Args:
+        folder_path (str): Path to the folder.
+        folder_mtime (int): The folder's st_mtime_ns when it was scanned.
+    
+    Returns:
+        bool: True if the folder's mtime differs or it cannot be read.
+    """
+    try:
+        return os.stat(folder_path).st_mtime_ns != folder_mtime
+    except OSError:
+        return True
+
+
+def _empty_scan_key(folder_path, recursive, lo, hi, file_type=""):
+    """
+    Build the _empty_scans key for a scan. Empty results don't depend on how the
+    folder was spelled, so the absolute path is used.
+    
+    Args:
+        folder_path (str): Path to the folder.
+        recursive (bool): Whether the scan includes subfolders.
+        lo (float): Lowest accepted mtime as a POSIX timestamp, or None.
+        hi (float): Highest accepted mtime as a POSIX timestamp, or None.
+        file_type (str): Lowercased extension filter, or "" for none. Defaults to "".
+    
+    Returns:
+        tuple: (abs_folder, recursive, lo, hi, file_type)
+    """
+    return os.path.abspath(folder_path), recursive, lo, hi, file_type
+
+
+def _mark_empty(key, scanned_at=None):
+    """
+    Remember that a scan matched no files.
+    
+    Args:
+        key (tuple): Key from _empty_scan_key.
+        scanned_at (float): time.monotonic() of the scan. If None, uses the current time.
+    """
+    try:
+        folder_mtime = os.stat(key[0]).st_mtime_ns
+    except OSError:
+        return
+    _empty_scans[key] = (time.monotonic() if scanned_at is None else scanned_at, folder_mtime)
+
+
+def _is_known_empty(key, cache_ttl=_CACHE_TTL):
+    """
+    Check whether a scan recently matched no files.
+    For non-recursive scans the folder's own mtime must also be unchanged,
+    so files added since the scan are noticed with a single stat.
+    
+    Args:
+        key (tuple): Key from _empty_scan_key.
+        cache_ttl (float): Seconds an empty result stays valid. Defaults to _CACHE_TTL.
+    
+    Returns:
+        bool: True if the scan matched nothing within the last cache_ttl seconds.
+    """
+    cached = _empty_scans.get(key)
+    if cached is None:
+        return False
+    scanned_at, folder_mtime = cached
+    if time.monotonic() - scanned_at > cache_ttl:
+        del _empty_scans[key]
+        return False
+    if not key[1] and _folder_changed(key[0], folder_mtime):
+        del _empty_scans[key]
+        return False
+    return True
+
+
+def _invalidate_cache(added_to=()):
+    """
+    Drop cached scans after files were deleted or moved.
+    Removing files can't make an empty scan match, so empty scans are only
+    forgotten for folders that files were moved into.
+    
+    Args:
+        added_to (iterable): Folders that received files.
+    """
+    _scan.cache_clear()
+    for folder in added_to:
+        folder = os.path.abspath(folder)
+        stale = [key for key in _empty_scans
+                 if folder == key[0] or folder.startswith(os.path.join(key[0], ""))]
+        for key in stale:
+            del _empty_scans[key]
+
+
+def clear_cache():
+    """
+    Forget all cached folder scans, including scans known to be empty.
+    """
+    _scan.cache_clear()
+    _empty_scans.clear()
+
+
+def iter_files_in_folder(folder_path: str = ".", start_date: datetime | None = None, end_date: datetime | None = None,
+                         recursive: bool = False, with_mtime: bool = True) -> Iterator[tuple[str, str, float | None]]:
+    """
+    Iterate over the files in the specified folder, optionally filtered by date range.
+    Excludes picture files (jpg, jpeg, png, gif, bmp, webp, svg, tiff, ico).
+    Unlike read_files_in_folder, errors are raised to the caller and nothing is cached.
+    
+    Args:
+        folder_path (str): Path to the folder. Defaults to current folder.
+        start_date (datetime): Start date for filtering. If None, no lower bound.
+        end_date (datetime): End date for filtering. If None, no upper bound.
+        recursive (bool): If True, search in subfolders. Defaults to False.
+        with_mtime (bool): If False and no dates are given, files are not stat'ed and mtime is None. Defaults to True.
+    
+    Yields:
+        tuple: (full_path, file_name, mtime) for each file matching the date criteria.
+    """
+    # Bounds as POSIX timestamps so mtimes can be compared directly
+    lo = start_date.timestamp() if start_date else None
+    hi = end_date.timestamp() if end_date else None
+    return _match_files(folder_path, lo, hi, recursive, with_mtime)
 
 
-def read_files_in_folder(folder_path=".", start_date=None, end_date=None, recursive=False):
+def read_files_in_folder(folder_path: str = ".", start_date: datetime | None = None, end_date: datetime | None = None,
+                         recursive: bool = False, cache_ttl: float = _CACHE_TTL,
+                         with_mtime: bool = True) -> list[tuple[str, str, float | None]]:
     """
     Read and list all files in the specified folder, optionally filtered by date range.
     Excludes picture files (jpg, jpeg, png, gif, bmp, webp, svg, tiff, ico).
+    Results are cached for cache_ttl seconds; deleting or moving files clears the cache.
+    For non-recursive scans a cached result is also dropped as soon as the folder's mtime changes.
+    Recursive scans are not checked that way: files added to a subfolder by another program
+    can be missed until the cache expires.
     
     Args:
         folder_path (str): Path to the folder. Defaults to current folder.
         start_date (datetime): Start date for filtering. If None, no lower bound.
         end_date (datetime): End date for filtering. If None, no upper bound.
         recursive (bool): If True, search in subfolders. Defaults to False.
+        cache_ttl (float): Seconds a cached scan stays valid. Use 0 to always rescan. Defaults to 5.0.
+        with_mtime (bool): If False and no dates are given, files are not stat'ed and mtime is None. Defaults to True.
     
     Returns:
-        list: List of tuples (full_path, file_name) for files matching the date criteria, excluding pictures.
+        list: List of tuples (full_path, file_name, mtime) for files matching the date criteria, excluding pictures.
     """
-    picture_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.tiff', '.ico'}
     try:
-        files = []
-        if recursive:
-            for root, dirs, filenames in os.walk(folder_path):
-                for f in filenames:
-                    file_path = os.path.join(root, f)
-                    # Skip picture files
-                    if Path(f).suffix.lower() in picture_extensions:
-                        continue
-                    if start_date or end_date:
-                        mod_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                        if start_date and mod_time < start_date:
-                            continue
-                        if end_date and mod_time > end_date:
-                            continue
-                    files.append((file_path, f))
-        else:
-            for f in os.listdir(folder_path):
-                file_path = os.path.join(folder_path, f)
-                if os.path.isfile(file_path):
-                    # Skip picture files
-                    if Path(f).suffix.lower() in picture_extensions:
-                        continue
-                    if start_date or end_date:
-                        mod_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                        if start_date and mod_time < start_date:
-                            continue
-                        if end_date and mod_time > end_date:
-                            continue
-                    files.append((file_path, f))
-        return files
+        lo = start_date.timestamp() if start_date else None
+        hi = end_date.timestamp() if end_date else None
+        if cache_ttl <= 0:
+            return list(_match_files(folder_path, lo, hi, recursive, with_mtime))
+        empty_key = _empty_scan_key(folder_path, recursive, lo, hi)
+        if _is_known_empty(empty_key, cache_ttl):
+            return []
+        key = (folder_path, os.getcwd(), lo, hi, recursive, with_mtime)
+        scanned_at, folder_mtime, files = _scan(*key)
+        if time.monotonic() - scanned_at > cache_ttl or (not recursive and _folder_changed(folder_path, folder_mtime)):
+            _scan.cache_clear()
+            scanned_at, folder_mtime, files = _scan(*key)
+        if not files:
+            _mark_empty(empty_key, scanned_at)
+        return list(files)
     except Exception as e:
         print(f"Error reading folder: {e}")
         return []
@@ -57,8 +417,10 @@ def read_files_in_folder(folder_path=".", start_date=None, end_date=None, recurs
 
 def read_files_in_folder_pathlib(folder_path=".", start_date=None, end_date=None, recursive=False):
     """
-    Read and list all files in the specified folder using pathlib, optionally filtered by date range.
+    Read and list the names of all files in the specified folder, optionally filtered by date range.
     Excludes picture files (jpg, jpeg, png, gif, bmp, webp, svg, tiff, ico).
+    
+    Deprecated: use read_files_in_folder, which returns full paths and mtimes as well.
       
     Args:
         folder_path (str): Path to the folder. Defaults to current folder.
@@ -69,74 +431,162 @@ def read_files_in_folder_pathlib(folder_path=".", start_date=None, end_date=None
     Returns:
         list: List of file names in the folder matching the date criteria, excluding pictures.
     """
-    picture_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.tiff', '.ico'}
+    warnings.warn(
+        "read_files_in_folder_pathlib is deprecated, use read_files_in_folder instead",
+        DeprecationWarning,
+        stacklevel=2
+    )
+    return [file_name for _, file_name, _ in read_files_in_folder(folder_path, start_date, end_date, recursive, with_mtime=False)]
+
+
+def list_files(folder_path: str = ".", start_date: datetime | None = None, end_date: datetime | None = None,
+               recursive: bool = False) -> list[tuple[str, str]]:
+    """
+    List the files delete_files would act on, without deleting or prompting.
+    Only walks the folder; files are stat'ed only when a date range is given.
+    
+    Args:
+        folder_path (str): Path to the folder. Defaults to current folder.
+        start_date (datetime): Start date for filtering. If None, no lower bound.
+        end_date (datetime): End date for filtering. If None, no upper bound.
+        recursive (bool): If True, search in subfolders. Defaults to False.
+    
+    Returns:
+        list: List of tuples (full_path, file_name) for files matching the date criteria, excluding pictures.
+    """
+    return [(file_path, file_name) for file_path, file_name, _ in
+            read_files_in_folder(folder_path, start_date, end_date, recursive, with_mtime=False)]
+
+
+def delete_files_stream(folder_path: str = ".", start_date: datetime | None = None, end_date: datetime | None = None,
+                        recursive: bool = False, jobs: int | None = None, quiet: bool = False) -> tuple[int, list[str]]:
+    """
+    Delete files as they are found, without building the file list or asking for confirmation.
+    Only the names of deleted files are kept, for the return value.
+    
+    Args:
+        folder_path (str): Path to the folder. Defaults to current folder.
+        start_date (datetime): Start date for filtering. If None, no lower bound.
+        end_date (datetime): End date for filtering. If None, no upper bound.
+        recursive (bool): If True, search in subfolders. Defaults to False.
+        jobs (int): Number of parallel delete threads. If None, uses min(32, 4 * CPU count).
+        quiet (bool): If True, don't print a line for each deleted file. Defaults to False.
+    
+    Returns:
+        tuple: (number of deleted files, list of file names deleted)
+    """
+    found_count = 0
+    deleted_count = 0
+    deleted_files: list[str] = []
+    empty_key = _empty_scan_key(folder_path, recursive,
+                                start_date.timestamp() if start_date else None,
+                                end_date.timestamp() if end_date else None)
+    if _is_known_empty(empty_key):
+        print("No files found to delete.")
+        return 0, []
     try:
-        path = Path(folder_path)
-        files = []
-        pattern = "**/*" if recursive else "*"
-        for f in path.glob(pattern):
-            if f.is_file():
-                # Skip picture files
-                if f.suffix.lower() in picture_extensions:
-                    continue
-                if start_date or end_date:
-                    mod_time = datetime.fromtimestamp(f.stat().st_mtime)
-                    if start_date and mod_time < start_date:
-                        continue
-                    if end_date and mod_time > end_date:
-                        continue
-                files.append(f.name)
-        return files
+        files = iter_files_in_folder(folder_path, start_date, end_date, recursive, with_mtime=False)
+        # Local names avoid global/attribute lookups per file
+        remove = os.remove
+        add_deleted = deleted_files.append
+        for (file_path, file_name, mtime), error in _run_jobs(lambda f: remove(f[0]), files, jobs):
+            found_count += 1
+            if error is None:
+                deleted_count += 1
+                add_deleted(file_name)
+                if not quiet:
+                    print(f"Deleted: {file_path}")
+            else:
+                print(f"Failed to delete {file_path}: {error}")
     except Exception as e:
-        print(f"Error reading folder: {e}")
-        return []
+        print(f"Error during deletion: {e}")
+    else:
+        # Everything that matched is gone, so a rerun would find nothing. Not for
+        # recursive scans: subfolders stay behind and their changes aren't tracked.
+        if deleted_count == found_count and not recursive:
+            _mark_empty(empty_key)
+    _invalidate_cache()
+    
+    if not found_count:
+        print("No files found to delete.")
+        return 0, []
+    
+    print(f"\nTotal files found: {found_count}")
+    print(f"Successfully deleted {deleted_count} file(s).")
+    return deleted_count, deleted_files
 
 
-def delete_files(folder_path=".", start_date=None, end_date=None, confirm=True, recursive=False):
+def delete_files(folder_path: str = ".", start_date: datetime | None = None, end_date: datetime | None = None,
+                 confirm: bool = True, recursive: bool = False, jobs: int | None = None, quiet: bool = False,
+                 verbose: bool = False, dry_run: bool = False) -> tuple[int, list[str]]:
     """
     Read files in a folder and delete them, optionally filtered by date range.
+    Scans are cached briefly (see read_files_in_folder); with recursive=True, files added to
+    a subfolder by another program within the cache TTL may be missed.
     
     Args:
         folder_path (str): Path to the folder. Defaults to current folder.
         start_date (datetime): Start date for filtering. If None, no lower bound.
         end_date (datetime): End date for filtering. If None, no upper bound.
         confirm (bool): If True, ask for confirmation before deleting. Defaults to True.
+            If False, files are deleted as they are found (see delete_files_stream).
         recursive (bool): If True, search in subfolders. Defaults to False.
+        jobs (int): Number of parallel delete threads. If None, uses min(32, 4 * CPU count).
+        quiet (bool): If True, don't print a line for each deleted file. Defaults to False.
+        verbose (bool): If True, list every file before confirming instead of the first 20. Defaults to False.
+        dry_run (bool): If True, only list the matching files; nothing is deleted and no prompt is shown. Defaults to False.
     
     Returns:
-        tuple: (number of deleted files, list of file names deleted)
+        tuple: (number of deleted files, list of file names deleted).
+            With dry_run, the number and names of the files that would be deleted.
     """
+    if not confirm and not dry_run:
+        return delete_files_stream(folder_path, start_date, end_date, recursive, jobs, quiet)
+    
     try:
         # Get list of files to delete
-        files_to_delete = read_files_in_folder(folder_path, start_date, end_date, recursive)
+        files_to_delete = list_files(folder_path, start_date, end_date, recursive)
         
         if not files_to_delete:
             print("No files found to delete.")
             return 0, []
         
+        if dry_run:
+            print(f"Files that would be deleted ({len(files_to_delete)}):")
+            _print_preview(files_to_delete, verbose)
+            return len(files_to_delete), [file_name for _, file_name in files_to_delete]
+        
         # Show files to be deleted
         print(f"Files to be deleted ({len(files_to_delete)}):")
-        for file_path, file_name in files_to_delete:
-            print(f"  - {file_path}")
+        _print_preview(files_to_delete, verbose)
         
-        # Ask for confirmation
-        if confirm:
-            response = input(f"\nAre you sure you want to delete these files? Total files: {len(files_to_delete)} (yes/no): ")
-            if response.lower() != "yes":
-                print("Deletion cancelled.")
-                return 0, []
+        # Ask for confirmation, warming the inode cache while the user decides
+        _start_prefetch([f[0] for f in files_to_delete])
+        response = input(f"\nAre you sure you want to delete these files? Total files: {len(files_to_delete)} (yes/no): ")
+        if response.lower() != "yes":
+            print("Deletion cancelled.")
+            return 0, []
         
         # Delete files
         deleted_count = 0
-        deleted_files = []
-        for file_path, file_name in files_to_delete:
-            try:
-                os.remove(file_path)
+        deleted_files: list[str] = []
+        # Local names avoid global/attribute lookups per file
+        remove = os.remove
+        add_deleted = deleted_files.append
+        for (file_path, file_name), error in _run_jobs(lambda f: remove(f[0]), files_to_delete, jobs):
+            if error is None:
                 deleted_count += 1
-                deleted_files.append(file_name)
-                print(f"Deleted: {file_path}")
-            except Exception as e:
-                print(f"Failed to delete {file_path}: {e}")
+                add_deleted(file_name)
+                if not quiet:
+                    print(f"Deleted: {file_path}")
+            else:
+                print(f"Failed to delete {file_path}: {error}")
+        
+        _invalidate_cache()
+        if deleted_count == len(files_to_delete) and not recursive:
+            _mark_empty(_empty_scan_key(folder_path, recursive,
+                                        start_date.timestamp() if start_date else None,
+                                        end_date.timestamp() if end_date else None))
         
         print(f"\nTotal files found: {len(files_to_delete)}")
         print(f"Successfully deleted {deleted_count} file(s).")
@@ -147,7 +597,7 @@ def delete_files(folder_path=".", start_date=None, end_date=None, confirm=True,
         return 0, []
 
 
-def move_files_by_type(source_folder=".", file_type="", destination_folder=".", start_date=None, end_date=None, confirm=True, recursive=False):
+def move_files_by_type(source_folder=".", file_type="", destination_folder=".", start_date=None, end_date=None, confirm=True, recursive=False, jobs=1, quiet=False, verbose=False):
     """
     Move files of a specific type to a destination folder, optionally filtered by date range.
     
@@ -159,59 +609,79 @@ def move_files_by_type(source_folder=".", file_type="", destination_folder=".",
         end_date (datetime): End date for filtering. If None, no upper bound.
         confirm (bool): If True, ask for confirmation before moving. Defaults to True.
         recursive (bool): If True, search in subfolders. Defaults to False.
+        jobs (int): Number of parallel move threads. Defaults to 1.
+        quiet (bool): If True, don't print a line for each moved file. Defaults to False.
+        verbose (bool): If True, list every file before confirming instead of the first 20. Defaults to False.
     
     Returns:
         tuple: (number of moved files, list of file names moved)
     """
-    import shutil
-    
     try:
         # Create destination folder if it doesn't exist
-        if not os.path.exists(destination_folder):
+        try:
             os.makedirs(destination_folder)
             print(f"Created destination folder: {destination_folder}")
+        except FileExistsError:
+            pass
         
         # Normalize file_type to include dot if not present
         if file_type and not file_type.startswith("."):
             file_type = "." + file_type
         
+        target = file_type.lower()
+        
+        # Skip the scan if this type recently matched nothing
+        empty_key = _empty_scan_key(source_folder, recursive,
+                                    start_date.timestamp() if start_date else None,
+                                    end_date.timestamp() if end_date else None,
+                                    target)
+        if _is_known_empty(empty_key):
+            print(f"No files found with type '{file_type}' to move.")
+            return 0, []
+        
         # Get list of files
-        all_files = read_files_in_folder(source_folder, start_date, end_date, recursive)
+        all_files = read_files_in_folder(source_folder, start_date, end_date, recursive, with_mtime=False)
         
-        # Filter by file type
-        files_to_move = []
-        for file_path, file_name in all_files:
-            if not file_type or Path(file_name).suffix.lower() == file_type.lower():
-                files_to_move.append((file_path, file_name))
+        # Filter by file type; like Path.suffix, a bare dotfile such as ".pdf" has no extension
+        join = os.path.join
+        files_to_move = [(file_path, file_name, join(destination_folder, file_name))
+                         for file_path, file_name, mtime in all_files
+                         if not target or (file_name.lower().endswith(target) and file_name.rfind('.') > 0)]
         
         if not files_to_move:
+            _mark_empty(empty_key)
             print(f"No files found with type '{file_type}' to move.")
             return 0, []
         
         # Show files to be moved
         print(f"Files to be moved ({len(files_to_move)}):")
-        for file_path, file_name in files_to_move:
-            print(f"  - {file_path}")
+        _print_preview(files_to_move, verbose)
         
         # Ask for confirmation
         if confirm:
+            _start_prefetch([f[0] for f in files_to_move])
             response = input(f"\nAre you sure you want to move these files? Total files: {len(files_to_move)} (yes/no): ")
             if response.lower() != "yes":
                 print("Move cancelled.")
                 return 0, []
         
-        # Move files
+        # Move files, renaming in place when nothing has to be copied
+        same_fs = _same_filesystem(source_folder, destination_folder)
         moved_count = 0
         moved_files = []
-        for file_path, file_name in files_to_move:
-            try:
-                destination_path = os.path.join(destination_folder, file_name)
-                shutil.move(file_path, destination_path)
+        # Local names avoid global/attribute lookups per file
+        move = _move_file
+        add_moved = moved_files.append
+        for (file_path, file_name, destination_path), error in _run_jobs(lambda f: move(f[0], f[2], same_fs), files_to_move, jobs):
+            if error is None:
                 moved_count += 1
-                moved_files.append(file_name)
-                print(f"Moved: {file_path} -> {destination_path}")
-            except Exception as e:
-                print(f"Failed to move {file_path}: {e}")
+                add_moved(file_name)
+                if not quiet:
+                    print(f"Moved: {file_path} -> {destination_path}")
+            else:
+                print(f"Failed to move {file_path}: {error}")
+        
+        _invalidate_cache([destination_folder])
         
         print(f"\nTotal files found: {len(files_to_move)}")
         print(f"Successfully moved {moved_count} file(s).")
@@ -222,7 +692,9 @@ def move_files_by_type(source_folder=".", file_type="", destination_folder=".",
         return 0, []
 
 
-def move_files_by_year(source_folder=".", destination_folder=None, confirm=True, recursive=False):
+def move_files_by_year(source_folder: str = ".", destination_folder: str | None = None, confirm: bool = True,
+                       recursive: bool = False, jobs: int = 1, quiet: bool = False,
+                       verbose: bool = False) -> tuple[int, dict[str, list[str]]]:
     """
     Move files to year-based folders based on their modification date.
     Creates folders named with the year (e.g., 2025, 2026) and organizes files accordingly.
@@ -232,12 +704,13 @@ def move_files_by_year(source_folder=".", destination_folder=None, confirm=True,
         destination_folder (str): Base path where year folders will be created. If None, uses source_folder.
         confirm (bool): If True, ask for confirmation before moving. Defaults to True.
         recursive (bool): If True, search in subfolders. Defaults to False.
+        jobs (int): Number of parallel move threads. Defaults to 1.
+        quiet (bool): If True, don't print a line for each moved file. Defaults to False.
+        verbose (bool): If True, list every file before confirming instead of the first 20. Defaults to False.
     
     Returns:
         tuple: (number of moved files, dict with year as key and list of moved file names as value)
     """
-    import shutil
-    
     try:
         # Use source folder as destination if not specified
         if destination_folder is None:
@@ -251,14 +724,11 @@ def move_files_by_year(source_folder=".", destination_folder=None, confirm=True,
             return 0, {}
         
         # Organize files by year
-        files_by_year = {}
-        for file_path, file_name in all_files:
+        files_by_year = defaultdict(list)
+        localtime = time.localtime
+        for file_path, file_name, mtime in all_files:
             try:
-                mod_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                year = str(mod_time.year)
-                if year not in files_by_year:
-                    files_by_year[year] = []
-                files_by_year[year].append((file_path, file_name))
+                files_by_year[localtime(mtime).tm_year].append((file_path, file_name))
             except Exception as e:
                 print(f"Warning: Could not get modification date for {file_path}: {e}")
         
@@ -266,51 +736,63 @@ def move_files_by_year(source_folder=".", destination_folder=None, confirm=True,
         print(f"Files to be moved by year ({len(all_files)} total):")
         for year in sorted(files_by_year.keys()):
             print(f"  {year}: {len(files_by_year[year])} file(s)")
-            for file_path, file_name in files_by_year[year]:
-                print(f"    - {file_path}")
+            _print_preview(files_by_year[year], verbose, indent="    ")
         
         # Ask for confirmation
         if confirm:
+            _start_prefetch([f[0] for f in all_files])
             response = input(f"\nAre you sure you want to move these files? Total files: {len(all_files)} (yes/no): ")
             if response.lower() != "yes":
                 print("Move cancelled.")
                 return 0, {}
         
-        # Create year folders and move files
+        # Create year folders and collect the moves
         moved_count = 0
-        moved_files = {}
+        moved_files: dict[int, list[str]] = {}
+        same_fs: dict[int, bool] = {}
+        moves: list[tuple[str, str, str, int]] = []
+        year_folders = {year: os.path.join(destination_folder, str(year)) for year in files_by_year}
         
-        for year, files in files_by_year.items():
-            year_folder = os.path.join(destination_folder, year)
-            
-            # Create year folder if it doesn't exist
-            if not os.path.exists(year_folder):
+        # Create each year folder once, before any file is moved
+        for year, year_folder in year_folders.items():
+            try:
                 os.makedirs(year_folder)
                 print(f"Created folder: {year_folder}")
-            
+            except FileExistsError:
+                pass
+            same_fs[year] = _same_filesystem(source_folder, year_folder)
             moved_files[year] = []
-            
-            # Move files to year folder
+        
+        join = os.path.join
+        add_move = moves.append
+        for year, files in files_by_year.items():
+            year_folder = year_folders[year]
             for file_path, file_name in files:
-                try:
-                    destination_path = os.path.join(year_folder, file_name)
-                    shutil.move(file_path, destination_path)
-                    moved_count += 1
-                    moved_files[year].append(file_name)
+                add_move((file_path, file_name, join(year_folder, file_name), year))
+        
+        # Move files to year folders; local name avoids a global lookup per file
+        move = _move_file
+        for (file_path, file_name, destination_path, year), error in _run_jobs(lambda f: move(f[0], f[2], same_fs[f[3]]), moves, jobs):
+            if error is None:
+                moved_count += 1
+                moved_files[year].append(file_name)
+                if not quiet:
                     print(f"Moved: {file_path} -> {destination_path}")
-                except Exception as e:
-                    print(f"Failed to move {file_path}: {e}")
+            else:
+                print(f"Failed to move {file_path}: {error}")
+        
+        _invalidate_cache(year_folders.values())
         
         print(f"\nTotal files found: {len(all_files)}")
         print(f"Successfully moved {moved_count} file(s).")
-        return moved_count, moved_files
+        return moved_count, {str(year): names for year, names in moved_files.items()}
     
     except Exception as e:
         print(f"Error during move: {e}")
         return 0, {}
 
 
-def move_files_by_keyword(source_folder=".", keywords=None, confirm=True, recursive=False):
+def move_files_by_keyword(source_folder=".", keywords=None, confirm=True, recursive=False, verbose=False):
     """
     Move files to folders based on keywords found in their filenames.
     Creates folders for each keyword and organizes files accordingly.
@@ -320,19 +802,18 @@ def move_files_by_keyword(source_folder=".", keywords=None, confirm=True, recurs
         keywords (list): List of keywords to match (e.g., ["Stellar", "AXI"]). If None, defaults to ["Stellar", "AXI"].
         confirm (bool): If True, ask for confirmation before moving. Defaults to True.
         recursive (bool): If True, search in subfolders. Defaults to False.
+        verbose (bool): If True, list every file before confirming instead of the first 20. Defaults to False.
     
     Returns:
         tuple: (number of moved files, dict with keyword as key and list of moved file names as value)
     """
-    import shutil
-    
     try:
         # Default keywords if not specified
         if keywords is None:
             keywords = ["Stellar", "AXI"]
         
         # Get list of all files
-        all_files = read_files_in_folder(source_folder, recursive=recursive)
+        all_files = read_files_in_folder(source_folder, recursive=recursive, with_mtime=False)
         
         if not all_files:
             print("No files found to move.")
@@ -342,7 +823,7 @@ def move_files_by_keyword(source_folder=".", keywords=None, confirm=True, recurs
         files_by_keyword = {}
         unmatched_files = []
         
-        for file_path, file_name in all_files:
+        for file_path, file_name, mtime in all_files:
             matched = False
             for keyword in keywords:
                 if keyword.lower() in file_name.lower():
@@ -361,16 +842,15 @@ def move_files_by_keyword(source_folder=".", keywords=None, confirm=True, recurs
         for keyword in keywords:
             if keyword in files_by_keyword:
                 print(f"  {keyword}: {len(files_by_keyword[keyword])} file(s)")
-                for file_path, file_name in files_by_keyword[keyword]:
-                    print(f"    - {file_path}")
+                _print_preview(files_by_keyword[keyword], verbose, indent="    ")
         
         if unmatched_files:
             print(f"  Unmatched: {len(unmatched_files)} file(s)")
-            for file_path, file_name in unmatched_files:
-                print(f"    - {file_path}")
+            _print_preview(unmatched_files, verbose, indent="    ")
         
         # Ask for confirmation
         if confirm and total_to_move > 0:
+            _start_prefetch([f[0] for files in files_by_keyword.values() for f in files])
             response = input(f"\nAre you sure you want to move these files? Total files: {total_to_move} (yes/no): ")
             if response.lower() != "yes":
                 print("Move cancelled.")
@@ -380,8 +860,11 @@ def move_files_by_keyword(source_folder=".", keywords=None, confirm=True, recurs
         moved_count = 0
         moved_files = {}
         
+        # Local names avoid global/attribute lookups per file
+        move = shutil.move
+        join = os.path.join
         for keyword, files in files_by_keyword.items():
-            keyword_folder = os.path.join(source_folder, keyword)
+            keyword_folder = join(source_folder, keyword)
             
             # Create keyword folder if it doesn't exist
             if not os.path.exists(keyword_folder):
@@ -393,14 +876,16 @@ def move_files_by_keyword(source_folder=".", keywords=None, confirm=True, recurs
             # Move files to keyword folder
             for file_path, file_name in files:
                 try:
-                    destination_path = os.path.join(keyword_folder, file_name)
-                    shutil.move(file_path, destination_path)
+                    destination_path = join(keyword_folder, file_name)
+                    move(file_path, destination_path)
                     moved_count += 1
                     moved_files[keyword].append(file_name)
                     print(f"Moved: {file_path} -> {destination_path}")
                 except Exception as e:
                     print(f"Failed to move {file_path}: {e}")
         
+        _invalidate_cache([os.path.join(source_folder, keyword) for keyword in files_by_keyword])
+        
         print(f"\nTotal files found: {len(all_files)}")
         print(f"Successfully moved {moved_count} file(s).")
         return moved_count, moved_files
@@ -422,6 +907,7 @@ Examples:
   python read_files.py -p "files"
   python read_files.py -p "files" -s 2026-01-01 -e 2026-01-14
   python read_files.py -p "files" -s 2026-01-10 --no-confirm
+  python read_files.py -p "files" -r --dry-run
         """
     )
     
@@ -448,6 +934,27 @@ Examples:
         action="store_true",
         help="Search in subfolders recursively"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Number of parallel delete threads (default: 4 per CPU, up to 32)"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Don't print a line for each deleted file"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="List every file before confirming (default: first 20)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only list the files that would be deleted, without prompting or deleting"
+    )
     
     args = parser.parse_args()
     
@@ -469,14 +976,18 @@ Examples:
             print(f"Error: Invalid end date format. Use YYYY-MM-DD")
             return
     
-    # Call delete_files
-    confirm = not args.no_confirm
+    # Call delete_files; a dry run never prompts
+    confirm = not (args.no_confirm or args.dry_run)
     deleted_count, deleted_files = delete_files(
         folder_path=args.path,
         start_date=start_date,
         end_date=end_date,
         confirm=confirm,
-        recursive=args.recursive
+        recursive=args.recursive,
+        jobs=args.jobs,
+        quiet=args.quiet,
+        verbose=args.verbose,
+        dry_run=args.dry_run
     )
 
 
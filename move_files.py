@@ -16,6 +16,7 @@ Examples:
   python move_files.py -s files -d /path/to/destination
   python move_files.py -s files -r
   python move_files.py -s files --no-confirm -r
+  python move_files.py -s files -r -j 8
         """
     )
     
@@ -39,6 +40,22 @@ Examples:
         action="store_true",
         help="Skip confirmation prompt before moving"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of parallel move threads (default: 1)"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Don't print a line for each moved file"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="List every file before confirming (default: first 20 per year)"
+    )
     
     args = parser.parse_args()
     
@@ -48,7 +65,10 @@ Examples:
         source_folder=args.source,
         destination_folder=args.destination,
         confirm=confirm,
-        recursive=args.recursive
+        recursive=args.recursive,
+        jobs=args.jobs,
+        quiet=args.quiet,
+        verbose=args.verbose
     )
     
     print(f"\nMoved {moved_count} files")